@@ -6,25 +6,53 @@ Peg = Literal["A", "B", "C"]
 Move = Tuple[Peg, Peg]
 
 def can_move(pegs: Dict[Peg, List[int]], src: Peg, dst: Peg) -> bool:
-    if not pegs[src]:
-        return False
-    if not pegs[dst]:
-        return True
-    return pegs[src][-1] < pegs[dst][-1]
+    s, d = pegs[src], pegs[dst]
+    return bool(s) and (not d or s[-1] < d[-1])
 
 def move(pegs: Dict[Peg, List[int]], src: Peg, dst: Peg) -> None:
     if not can_move(pegs, src, dst):
         raise ValueError(f"Illegal move {src}->{dst}: {pegs[src]} -> {pegs[dst]}")
     pegs[dst].append(pegs[src].pop())
 
+def _peg_order(n: int, src: Peg, aux: Peg, dst: Peg) -> Tuple[Peg, Peg, Peg]:
+    """Cycle order the pegs are visited in, which depends on the parity of n."""
+    return (src, aux, dst) if n % 2 == 1 else (src, dst, aux)
+
+def _move_pegs(k: int) -> Tuple[int, int]:
+    """Positions in the peg cycle order of the source and target of move k (1-based)."""
+    return (k & (k - 1)) % 3, ((k | (k - 1)) + 1) % 3
+
 def solve_recursive(n: int, src: Peg, aux: Peg, dst: Peg) -> Generator[Move, None, None]:
-    """Yield optimal moves to solve n disks from src to dst using aux."""
-    if n == 1:
-        yield (src, dst)
-    else:
-        yield from solve_recursive(n - 1, src, dst, aux)
-        yield (src, dst)
-        yield from solve_recursive(n - 1, aux, src, dst)
+    """Yield optimal moves to solve n disks from src to dst using aux.
+
+    Produces the same sequence as the classic recursion, but iteratively,
+    computing each move from its number (see _move_pegs).
+    """
+    order = _peg_order(n, src, aux, dst)
+    # prebuilt move tuples, indexed by 3 * from + to, so no tuple is allocated
+    # per move; the _move_pegs formula is inlined to avoid a call per move
+    moves = [(p, q) for p in order for q in order]
+    for k in range(1, 1 << n):
+        yield moves[(k & (k - 1)) % 3 * 3 + ((k | (k - 1)) + 1) % 3]
+
+def move_count(n: int) -> int:
+    """Number of moves in an optimal solution for n disks."""
+    return (1 << n) - 1
+
+def disk_at_move(i: int) -> int:
+    """Size of the disk moved by the i-th (0-based) optimal move; 1 is the smallest."""
+    if i < 0:
+        raise ValueError(f"move index {i} must be non-negative")
+    k = i + 1
+    return (k & -k).bit_length()
+
+def move_at(n: int, i: int, src: Peg = "A", aux: Peg = "B", dst: Peg = "C") -> Move:
+    """Return the i-th (0-based) optimal move without generating the ones before it."""
+    if not 0 <= i < move_count(n):
+        raise ValueError(f"move index {i} out of range for n={n}")
+    order = _peg_order(n, src, aux, dst)
+    f, t = _move_pegs(i + 1)
+    return (order[f], order[t])
 
 def run(n: int, verbose: bool = True) -> Dict[Peg, List[int]]:
     if n <= 0:
@@ -39,10 +67,11 @@ def run(n: int, verbose: bool = True) -> Dict[Peg, List[int]]:
         if verbose:
             print(f"Move {moves_made:>3}: {s} -> {d} | {pegs}")
     if verbose:
-        optimal = (1 << n) - 1
+        optimal = move_count(n)
         print(f"Solved in {moves_made} moves (optimal {optimal}).")
-    # quick sanity check
-    assert pegs["C"] == list(range(n, 0, -1))
+    # quick sanity check: move() only allows legal moves, so a full peg C
+    # is necessarily ordered largest to smallest
+    assert len(pegs["C"]) == n
     return pegs
 
 if __name__ == "__main__":
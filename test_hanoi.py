@@ -1,6 +1,48 @@
-from hanoi import run
+import pytest
+
+from hanoi import disk_at_move, move, move_at, move_count, run, solve_recursive
+from solve_iterative import solve_iterative
+
+PEG_ORDERS = [("A", "B", "C"), ("B", "C", "A"), ("C", "A", "B")]
+
+def _reference(n, src, aux, dst):
+    if n == 0:
+        return []
+    return _reference(n - 1, src, dst, aux) + [(src, dst)] + _reference(n - 1, aux, src, dst)
 
 def test_small_sizes():
     for n in range(1, 6):
         pegs = run(n, verbose=False)
         assert pegs["C"] == list(range(n, 0, -1))
+
+def test_solver_matches_recursion():
+    for n in range(1, 9):
+        for src, aux, dst in PEG_ORDERS:
+            assert list(solve_recursive(n, src, aux, dst)) == _reference(n, src, aux, dst)
+
+def test_move_at_random_access():
+    for n in range(1, 8):
+        for src, aux, dst in PEG_ORDERS:
+            moves = list(solve_recursive(n, src, aux, dst))
+            assert [move_at(n, i, src, aux, dst) for i in range(len(moves))] == moves
+    with pytest.raises(ValueError):
+        move_at(3, 7)
+
+def test_move_count_and_disk_at_move():
+    for n in range(1, 8):
+        pegs = {"A": list(range(n, 0, -1)), "B": [], "C": []}
+        moves = list(solve_recursive(n, "A", "B", "C"))
+        assert len(moves) == move_count(n)
+        for i, (s, d) in enumerate(moves):
+            assert disk_at_move(i) == pegs[s][-1]
+            move(pegs, s, d)
+    with pytest.raises(ValueError):
+        disk_at_move(-1)
+
+def test_iterative_matches_recursive():
+    for n in range(1, 8):
+        for src, aux, dst in PEG_ORDERS:
+            steps = solve_iterative(n, src, aux, dst)
+            pegs = next(steps)
+            assert list(steps) == list(solve_recursive(n, src, aux, dst))
+            assert pegs[dst] == list(range(n, 0, -1))